@@ -1,16 +1,35 @@
+import os
+import re
+import csv
+import hashlib
 import time
 import random
 import argparse
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 
+import httpx
+import lxml.html
+import openpyxl
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import (
+    TimeoutException,
+    JavascriptException,
+    WebDriverException,
+)
+
+try:
+    import hyperscan
+except ImportError:  # Linux-only; fall back to the `re` scanner elsewhere
+    hyperscan = None
 
 
 # Path to your input Excel file
@@ -19,6 +38,15 @@ INPUT_FILE = "Patents Database.xlsx"  # update if your file has a different name
 # Output Excel name
 OUTPUT_EXCEL = "Patents_Full_Data.xlsx"
 
+# Rows are appended here as soon as they are scraped, so an interrupted
+# run can resume where it stopped. Removed once the Excel file is saved.
+CHECKPOINT_FILE = "Patents_Full_Data.partial.csv"
+
+# Extracted page text is cached here, one file per URL, so reruns (and
+# changes to the section parser) don't have to hit the network again.
+CACHE_DIR = Path("flintbox_cache")
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
 # Column in the sheet that contains the Flintbox URLs
 FLINTBOX_URL_COLUMN = "Flintbox Link"
 
@@ -51,9 +79,77 @@ SECTION_HEADER_VARIANTS: Dict[str, List[str]] = {
     "Other": ["other", "other information", "additional information", "notes", "miscellaneous"],
 }
 
+# Number of pages a single browser loads before it is recycled.
+# Long-lived Chrome sessions slowly bloat in memory, so restart them periodically.
+DRIVER_MAX_PAGES = 500
+
+# Per-thread browser state for the worker pool
+_thread_state = threading.local()
+_drivers_lock = threading.Lock()
+_live_drivers: List[webdriver.Remote] = []
+
+# Sub-resources the scraper never needs; blocking them speeds up page loads
+BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.woff",
+    "*.woff2",
+    "*.css",
+    "*doubleclick*",
+    "*google-analytics*",
+    "*googletagmanager*",
+]
+
+# Concurrency and timeout for the plain-HTTP pass that runs before Selenium
+STATIC_FETCH_CONCURRENCY = 32
+STATIC_FETCH_TIMEOUT = 15
+
+# Elements that end a line of text when HTML is flattened
+BLOCK_TAGS = (
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "footer", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main",
+    "nav", "ol", "p", "pre", "section", "table", "td", "th", "tr", "ul",
+)
+
+# Selector for the element holding the technology write-up
+CONTENT_SELECTOR = "main, [role='main'], div[data-testid='technology-page']"
+
+# Candidate containers for the page text, most specific first
+MAIN_CONTAINER_SELECTORS = [
+    "main",
+    "[role='main']",
+    "div[data-testid='technology-page']",
+    "div.MuiContainer-root",
+]
+
+# Returns the text of the first non-empty candidate, else the whole body
+MAIN_TEXT_SCRIPT = """
+for (const selector of arguments[0]) {
+    const el = document.querySelector(selector);
+    const text = el ? el.innerText.trim() : "";
+    if (text) return text;
+}
+return document.body ? document.body.innerText : "";
+"""
+
+# Minimum amount of text in the content element before the page counts as rendered
+CONTENT_MIN_CHARS = 200
 
-def create_driver() -> webdriver.Chrome:
-    """Create a headless Chrome Selenium WebDriver."""
+# Upper bound on how long to wait for dynamic content to render
+CONTENT_WAIT_SECONDS = 15
+
+
+def create_driver() -> webdriver.Remote:
+    """
+    Create a headless Chrome Selenium WebDriver.
+
+    If SELENIUM_REMOTE_URL is set, a session is opened on that already-running
+    chromedriver / Selenium server instead of launching a new Chrome.
+    """
     chrome_options = Options()
     # Headless Chrome
     chrome_options.add_argument("--headless=new")
@@ -61,136 +157,234 @@ def create_driver() -> webdriver.Chrome:
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
-
-    driver = webdriver.Chrome(options=chrome_options)
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    # Only the DOM text is needed, so don't wait for every sub-resource
+    chrome_options.page_load_strategy = "eager"
+
+    remote_url = os.environ.get("SELENIUM_REMOTE_URL")
+    if remote_url:
+        driver = webdriver.Remote(command_executor=remote_url, options=chrome_options)
+    else:
+        driver = webdriver.Chrome(options=chrome_options)
     driver.set_page_load_timeout(30)
+
+    # Skip images, fonts, stylesheets and trackers entirely.
+    # CDP is only reachable on a local Chrome; remote sessions rely on imagesEnabled=false.
+    if isinstance(driver, webdriver.Chrome):
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
     return driver
 
 
-def get_main_container_text(driver: webdriver.Chrome) -> str:
+def content_ready(driver: webdriver.Remote) -> bool:
+    """Return True once the main content element has rendered enough text."""
+    length = driver.execute_script(
+        "const el = document.querySelector(arguments[0]); return el ? el.innerText.length : 0;",
+        CONTENT_SELECTOR,
+    )
+    return length > CONTENT_MIN_CHARS
+
+
+def get_main_container_text(driver: webdriver.Remote) -> str:
     """
     Return the text content of the main container of the Flintbox page.
 
     To be aggressive, this falls back to the full body text if no specific
-    main container can be identified.
+    main container can be identified. The candidates are walked in-browser
+    with one script call; if that fails, the page source is parsed with lxml.
     """
-    candidates = [
-        (By.TAG_NAME, "main"),
-        (By.CSS_SELECTOR, "[role='main']"),
-        (By.CSS_SELECTOR, "div[data-testid='technology-page']"),
-        (By.CSS_SELECTOR, "div.MuiContainer-root"),
-    ]
-
-    for by, selector in candidates:
-        try:
-            el = driver.find_element(by, selector)
-            text = el.text.strip()
-            if text:
-                return text
-        except NoSuchElementException:
-            continue
+    try:
+        text = driver.execute_script(MAIN_TEXT_SCRIPT, MAIN_CONTAINER_SELECTORS)
+        if text is not None:
+            return text
+    except WebDriverException:
+        pass
 
-    # Fallback: entire body
+    # Fallback: parse the rendered HTML locally
     try:
-        body = driver.find_element(By.TAG_NAME, "body")
-        return body.text
-    except NoSuchElementException:
+        return html_to_text(driver.page_source)
+    except WebDriverException:
         return ""
 
 
-def extract_section_text_from_text(full_text: str, section_name: str) -> str:
+def _cache_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.txt"
+
+
+def load_cached_text(url: str) -> Optional[str]:
+    """Return the cached page text for a URL, or None if missing or expired."""
+    path = _cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime >= CACHE_TTL_SECONDS:
+            return None
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def store_cached_text(url: str, text: str) -> None:
+    """Cache the extracted text of a page."""
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        _cache_path(url).write_text(text, encoding="utf-8")
+    except OSError as exc:
+        print(f"  Could not cache text for {url}: {exc}")
+
+
+def html_to_text(html: str) -> str:
     """
-    Extract a section by scanning plain text lines for keywords such as
-    'Problem', 'Solution', 'Benefit', etc., then collecting subsequent lines
-    until another section header is reached.
+    Flatten raw page HTML into plain text with one block element per line,
+    preferring the main container over the full document.
     """
-    if not full_text:
+    try:
+        root = lxml.html.fromstring(html)
+    except (lxml.etree.ParserError, ValueError):
         return ""
 
-    header_variants = SECTION_HEADER_VARIANTS.get(section_name, [])
-    if not header_variants:
-        return ""
+    for el in root.xpath("//script|//style|//noscript|//template"):
+        el.drop_tree()
+    # Collapse source formatting like the browser's innerText does
+    for el in root.iter():
+        if el.text:
+            el.text = re.sub(r"\s+", " ", el.text)
+        if el.tail:
+            el.tail = re.sub(r"\s+", " ", el.tail)
+    # Break lines around block elements so section headers start a line
+    for el in root.iter(*BLOCK_TAGS):
+        el.text = "\n" + (el.text or "")
+        el.tail = "\n" + (el.tail or "")
+
+    containers = root.xpath("//main|//*[@role='main']")
+    node = containers[0] if containers else root
+    return node.text_content()
+
+
+def _build_header_regex() -> "re.Pattern[str]":
+    """
+    Compile every section keyword into one regex that matches a header at
+    the start of a line. Keywords are tried longest-first so that e.g.
+    'problem 1' wins over 'problem'.
+    """
+    alternation = "|".join(re.escape(kw) for kw in _HEADER_KEYWORDS)
+    # A header is the keyword followed by ':', a space, or the end of the line
+    return re.compile(rf"^(?P<hdr>{alternation})(?=[ \t:]|$)", re.IGNORECASE | re.MULTILINE)
+
 
-    # Prepare lines
-    lines = [ln.strip() for ln in full_text.splitlines() if ln.strip()]
-    lower_lines = [ln.lower() for ln in lines]
-
-    # Flatten all keywords to detect boundaries between sections
-    all_kw_to_section: Dict[str, str] = {}
-    for sec, kws in SECTION_HEADER_VARIANTS.items():
-        for kw in kws:
-            all_kw_to_section[kw.lower()] = sec
-
-    # Helper to test if a line looks like a section header
-    def match_header(line_lower: str, target_keywords: List[str]) -> Optional[str]:
-        for kw in target_keywords:
-            kw = kw.lower()
-            if line_lower.startswith(kw + ":") or line_lower == kw or line_lower.startswith(kw + " "):
-                return kw
+def _build_hyperscan_db() -> Optional["hyperscan.Database"]:
+    """Compile all section keywords into a single Hyperscan database, if available."""
+    if hyperscan is None:
         return None
 
-    def is_any_header(line_lower: str) -> bool:
-        for kw in all_kw_to_section.keys():
-            if line_lower.startswith(kw + ":") or line_lower == kw or line_lower.startswith(kw + " "):
-                return True
-        return False
-
-    start_idx: Optional[int] = None
-    header_inline_text: Optional[str] = None
-
-    # Find the header line for this section
-    for i, line_lower in enumerate(lower_lines):
-        kw = match_header(line_lower, header_variants)
-        if kw is not None:
-            original_line = lines[i]
-            # Capture any inline text after "Keyword:"
-            pos = original_line.lower().find(kw)
-            after = original_line[pos + len(kw) :]
-            if ":" in after:
-                after = after.split(":", 1)[1]
-            header_inline_text = after.strip(" :-\t")
-            start_idx = i + 1
-            break
-
-    if start_idx is None:
-        return ""
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_SOM_LEFTMOST
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[b"^" + re.escape(kw).encode("utf-8") for kw in _HEADER_KEYWORDS],
+        ids=list(range(len(_HEADER_KEYWORDS))),
+        elements=len(_HEADER_KEYWORDS),
+        flags=[flags] * len(_HEADER_KEYWORDS),
+    )
+    return db
 
-    # Collect until next header for any known section
-    collected: List[str] = []
-    if header_inline_text:
-        collected.append(header_inline_text)
 
-    for j in range(start_idx, len(lines)):
-        line_l = lower_lines[j]
-        if is_any_header(line_l):
-            break
-        collected.append(lines[j])
+# Flattened keyword -> section lookup, shared by all pages
+_KW_TO_SECTION: Dict[str, str] = {
+    kw.lower(): sec for sec, kws in SECTION_HEADER_VARIANTS.items() for kw in kws
+}
+_HEADER_KEYWORDS = sorted(_KW_TO_SECTION, key=len, reverse=True)
+_HEADER_RE = _build_header_regex()
+_HEADER_HS_DB = _build_hyperscan_db()
+# A Hyperscan database shares one scratch space, so scans are serialized
+_HEADER_HS_LOCK = threading.Lock()
+
+
+def _find_headers_hyperscan(text: str) -> List[Tuple[int, int, str]]:
+    """Hyperscan counterpart of _find_headers; same results, offsets in characters."""
+    data = text.encode("utf-8")
+    # Line start (byte offset) -> (end byte offset, keyword id) of the longest header there
+    hits: Dict[int, Tuple[int, int]] = {}
+
+    def on_match(kw_id: int, start: int, end: int, flags: int, context: object) -> None:
+        # Same boundary rule as the regex: keyword followed by ':', a space, or end of line
+        if data[end : end + 1] not in (b"", b" ", b"\t", b":", b"\n"):
+            return
+        if start not in hits or end > hits[start][0]:
+            hits[start] = (end, kw_id)
+
+    with _HEADER_HS_LOCK:
+        _HEADER_HS_DB.scan(data, match_event_handler=on_match)
+
+    def to_char(offset: int) -> int:
+        return offset if len(data) == len(text) else len(data[:offset].decode("utf-8"))
+
+    return [
+        (to_char(start), to_char(end), _KW_TO_SECTION[_HEADER_KEYWORDS[kw_id]])
+        for start, (end, kw_id) in sorted(hits.items())
+    ]
 
-    if not collected:
-        return ""
 
-    # Join and deduplicate consecutive duplicates
-    result_lines: List[str] = []
-    prev = None
-    for ln in collected:
-        if ln != prev:
-            result_lines.append(ln)
-        prev = ln
+def _find_headers(text: str) -> List[Tuple[int, int, str]]:
+    """Return (start, end, section name) for every header line, in order."""
+    if _HEADER_HS_DB is not None:
+        return _find_headers_hyperscan(text)
+    return [
+        (match.start(), match.end(), _KW_TO_SECTION[match.group("hdr").lower()])
+        for match in _HEADER_RE.finditer(text)
+    ]
 
-    return "\n".join(result_lines)
 
+def parse_all_sections(full_text: str) -> Dict[str, str]:
+    """
+    Split page text into sections in a single pass.
 
-def safe_get_url(row_value: object) -> Optional[str]:
-    """Convert a cell value to a usable URL string, if possible."""
-    if row_value is None:
-        return None
-    try:
-        text = str(row_value).strip()
-    except Exception:
-        return None
-    if not text or text.lower() in ("nan", "none"):
-        return None
-    return text
+    Each line starting with a known keyword ('Problem', 'Solution',
+    'Benefit', ...) opens a section that runs until the next header. Only
+    the first occurrence of each section is kept.
+    """
+    if not full_text:
+        return {}
+
+    # Normalize to stripped, non-empty lines so headers sit at line starts
+    text = "\n".join(ln.strip() for ln in full_text.splitlines() if ln.strip())
+    headers = _find_headers(text)
+
+    sections: Dict[str, str] = {}
+    for i, (_, header_end, section_name) in enumerate(headers):
+        if section_name in sections:
+            continue
+
+        end = headers[i + 1][0] if i + 1 < len(headers) else len(text)
+        header_rest, _, body = text[header_end:end].partition("\n")
+
+        # Capture any inline text after "Keyword:"
+        if ":" in header_rest:
+            header_rest = header_rest.split(":", 1)[1]
+        header_inline_text = header_rest.strip(" :-\t")
+
+        collected: List[str] = []
+        if header_inline_text:
+            collected.append(header_inline_text)
+        collected.extend(body.splitlines())
+
+        # Join and deduplicate consecutive duplicates
+        result_lines: List[str] = []
+        prev = None
+        for ln in collected:
+            if ln != prev:
+                result_lines.append(ln)
+            prev = ln
+
+        sections[section_name] = "\n".join(result_lines)
+
+    return sections
+
+
+def extract_section_text_from_text(full_text: str, section_name: str) -> str:
+    """
+    Extract a single section from plain page text.
+
+    Prefer parse_all_sections() when more than one section is needed.
+    """
+    return parse_all_sections(full_text).get(section_name, "")
 
 
 def load_input_dataframe() -> pd.DataFrame:
@@ -210,71 +404,283 @@ def load_input_dataframe() -> pd.DataFrame:
     return df
 
 
-def main(max_rows: Optional[int] = None) -> None:
-    # Load data
-    df = load_input_dataframe()
+def get_thread_driver() -> webdriver.Remote:
+    """
+    Return the browser owned by the current worker thread.
 
-    # Ensure required columns exist
-    if FLINTBOX_URL_COLUMN not in df.columns:
-        raise ValueError(f"Expected a column named '{FLINTBOX_URL_COLUMN}' in the input file.")
+    Each thread lazily creates one driver and reuses it across many URLs,
+    recycling it after DRIVER_MAX_PAGES page loads.
+    """
+    driver = getattr(_thread_state, "driver", None)
+    if driver is not None and _thread_state.pages >= DRIVER_MAX_PAGES:
+        release_driver(driver)
+        driver = None
+
+    if driver is None:
+        driver = create_driver()
+        with _drivers_lock:
+            _live_drivers.append(driver)
+        _thread_state.driver = driver
+        _thread_state.pages = 0
+
+    _thread_state.pages += 1
+    return driver
 
-    for col in TARGET_COLUMNS:
-        if col not in df.columns:
-            df[col] = ""
 
-    driver = create_driver()
+def release_driver(driver: webdriver.Remote) -> None:
+    """Quit a driver and forget about it."""
+    with _drivers_lock:
+        if driver in _live_drivers:
+            _live_drivers.remove(driver)
+    try:
+        driver.quit()
+    except WebDriverException:
+        pass
+
+
+def quit_all_drivers() -> None:
+    """Quit every driver created by the worker pool."""
+    with _drivers_lock:
+        drivers = list(_live_drivers)
+    for driver in drivers:
+        release_driver(driver)
+
+
+def process_url(driver: webdriver.Remote, url: str) -> Dict[str, str]:
+    """Load a single Flintbox page and return its non-empty sections."""
+    sections: Dict[str, str] = {}
     wait = WebDriverWait(driver, 20)
 
     try:
-        for idx, row in df.iterrows():
-            if max_rows is not None and idx >= max_rows:
-                break
+        driver.get(url)
+        # Wait for the page body to load
+        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        # Wait for dynamic content to render; on timeout use whatever is there
+        try:
+            WebDriverWait(
+                driver,
+                CONTENT_WAIT_SECONDS,
+                poll_frequency=0.25,
+                ignored_exceptions=(JavascriptException,),
+            ).until(content_ready)
+        except TimeoutException:
+            pass
+
+        # Grab main container text once per page
+        full_text = get_main_container_text(driver)
+        if full_text.strip():
+            store_cached_text(url, full_text)
+
+        # Extract all sections from the plain text in one pass
+        try:
+            parsed = parse_all_sections(full_text)
+        except Exception as exc:
+            print(f"  Error extracting sections from {url}: {exc}")
+            parsed = {}
 
-            try:
-                url = safe_get_url(row.get(FLINTBOX_URL_COLUMN))
-                if not url:
-                    continue
+        sections = {col: text for col, text in parsed.items() if text}
 
-                print(f"Processing row {idx + 1}: {url}")
+    except (TimeoutException, WebDriverException) as exc:
+        print(f"  Error loading {url}: {exc}")
 
-                try:
-                    driver.get(url)
-                    # Wait for the page body to load
-                    wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                    # Allow extra time for dynamic content to render
-                    time.sleep(5)
+    return sections
 
-                    # Grab main container text once per page
-                    full_text = get_main_container_text(driver)
 
-                    # Extract all sections from the plain text
-                    for col in TARGET_COLUMNS:
-                        try:
-                            section_text = extract_section_text_from_text(full_text, col)
-                        except Exception as exc:
-                            print(f"  Error extracting section '{col}' from {url}: {exc}")
-                            section_text = ""
+async def fetch_static_sections(urls: List[str]) -> Dict[str, Dict[str, str]]:
+    """
+    Fetch pages over plain HTTP and parse their server-rendered HTML.
 
-                        if section_text:
-                            df.at[idx, col] = section_text
+    Returns the non-empty sections for every URL that yielded at least one
+    section. Pages that render client-side come back empty and are left
+    for the Selenium workers.
+    """
+    semaphore = asyncio.Semaphore(STATIC_FETCH_CONCURRENCY)
 
-                except (TimeoutException, WebDriverException) as exc:
-                    print(f"  Error loading {url}: {exc}")
+    async with httpx.AsyncClient(http2=True, timeout=STATIC_FETCH_TIMEOUT, follow_redirects=True) as client:
 
-                # Small delay between requests to be polite
-                time.sleep(2.0 + random.uniform(0.0, 1.0))
+        async def fetch_one(url: str) -> Tuple[str, Dict[str, str]]:
+            async with semaphore:
+                try:
+                    response = await client.get(url)
+                    response.raise_for_status()
+                except httpx.HTTPError as exc:
+                    print(f"  Static fetch failed for {url}: {exc}")
+                    return url, {}
 
+            full_text = html_to_text(response.text)
+            try:
+                parsed = parse_all_sections(full_text)
             except Exception as exc:
-                # Catch-all so that a single bad row doesn't stop the whole run.
-                print(f"Unexpected error on row {idx + 1}: {exc}")
+                print(f"  Error extracting sections from {url}: {exc}")
+                parsed = {}
+
+            sections = {col: text for col, text in parsed.items() if text}
+            if sections:
+                store_cached_text(url, full_text)
+            return url, sections
 
+        results = await asyncio.gather(*(fetch_one(url) for url in dict.fromkeys(urls)))
+
+    return {url: sections for url, sections in results if sections}
+
+
+def check_static_parse(url: str) -> bool:
+    """
+    Parse one page both from its static HTML and in the browser, and print
+    any section where the two disagree. Returns True when they match.
+    """
+    response = httpx.get(url, timeout=STATIC_FETCH_TIMEOUT, follow_redirects=True)
+    response.raise_for_status()
+    static = {col: text for col, text in parse_all_sections(html_to_text(response.text)).items() if text}
+
+    driver = create_driver()
+    try:
+        browser = process_url(driver, url)
     finally:
         driver.quit()
 
+    matches = True
+    for col in TARGET_COLUMNS:
+        static_text, browser_text = static.get(col, ""), browser.get(col, "")
+        if static_text != browser_text:
+            matches = False
+            print(f"  {col}: static HTML {len(static_text)} chars, browser {len(browser_text)} chars")
+
+    print("Static parse matches the browser." if matches else "Static parse differs from the browser.")
+    return matches
+
+
+def process_row(item: Tuple[int, str]) -> Tuple[int, Dict[str, str]]:
+    """Worker entry point: scrape one (row index, URL) pair with this thread's driver."""
+    idx, url = item
+    print(f"Processing row {idx + 1}: {url}")
+
+    # Not caught below: a browser that can't start is fatal for the whole run
+    driver = get_thread_driver()
+    try:
+        sections = process_url(driver, url)
+    except Exception as exc:
+        # Catch-all so that a single bad row doesn't stop the whole run.
+        print(f"Unexpected error on row {idx + 1}: {exc}")
+        sections = {}
+
+    # Small delay between requests to be polite
+    time.sleep(2.0 + random.uniform(0.0, 1.0))
+    return idx, sections
+
+
+def fast_to_excel(df: pd.DataFrame, path: str) -> None:
+    """
+    Save a DataFrame to .xlsx through openpyxl's write-only workbook.
+
+    Rows are streamed straight to disk (using lxml when it is installed),
+    which is much faster and lighter than DataFrame.to_excel.
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append([str(c) for c in df.columns])
+
+    # Empty cells become None so they are written as blanks, like to_excel does
+    values = df.astype(object).where(df.notna(), None)
+    for row in values.itertuples(index=False, name=None):
+        ws.append(row)
+
+    wb.save(path)
+
+
+def load_checkpoint() -> Dict[str, Dict[str, str]]:
+    """Return the sections already scraped by an interrupted run, keyed by URL."""
+    path = Path(CHECKPOINT_FILE)
+    if not path.exists():
+        return {}
+
+    scraped: Dict[str, Dict[str, str]] = {}
+    with path.open(newline="", encoding="utf-8") as fh:
+        for record in csv.DictReader(fh):
+            url = record.pop(FLINTBOX_URL_COLUMN, None)
+            if url:
+                scraped[url] = {col: text for col, text in record.items() if col in TARGET_COLUMNS and text}
+    return scraped
+
+
+def main(max_rows: Optional[int] = None, workers: int = 1) -> None:
+    # Load data
+    df = load_input_dataframe()
+
+    # Ensure required columns exist
+    if FLINTBOX_URL_COLUMN not in df.columns:
+        raise ValueError(f"Expected a column named '{FLINTBOX_URL_COLUMN}' in the input file.")
+
+    missing = [col for col in TARGET_COLUMNS if col not in df.columns]
+    df = df.reindex(columns=list(df.columns) + missing, fill_value="")
+    # Sections are text; empty sheet columns would otherwise load as float
+    df[TARGET_COLUMNS] = df[TARGET_COLUMNS].astype(object)
+
+    # Collect the rows that have a usable URL
+    urls = df[FLINTBOX_URL_COLUMN].iloc[:max_rows].astype("string").str.strip()
+    valid = urls.notna() & (urls != "") & ~urls.str.lower().isin(["nan", "none"])
+    jobs: List[Tuple[int, str]] = list(urls[valid].items())
+
+    # Skip URLs already scraped by an interrupted run
+    scraped = load_checkpoint()
+    if scraped:
+        print(f"Resuming from '{CHECKPOINT_FILE}' ({len(scraped)} URL(s) already scraped).")
+    pending = [(idx, url) for idx, url in jobs if url not in scraped]
+
+    with open(CHECKPOINT_FILE, "a", newline="", encoding="utf-8") as checkpoint:
+        writer = csv.DictWriter(checkpoint, fieldnames=[FLINTBOX_URL_COLUMN] + TARGET_COLUMNS)
+        if checkpoint.tell() == 0:
+            writer.writeheader()
+
+        def record(url: str, sections: Dict[str, str]) -> None:
+            scraped[url] = sections
+            writer.writerow({FLINTBOX_URL_COLUMN: url, **sections})
+            checkpoint.flush()
+
+        # Pages cached by a recent run don't need fetching at all
+        for url in dict.fromkeys(url for _, url in pending):
+            cached_text = load_cached_text(url)
+            if cached_text is None:
+                continue
+            sections = {col: text for col, text in parse_all_sections(cached_text).items() if text}
+            if sections:
+                record(url, sections)
+        pending = [(idx, url) for idx, url in pending if url not in scraped]
+
+        # Cheap pass first: server-rendered pages don't need a browser
+        static = asyncio.run(fetch_static_sections([url for _, url in pending]))
+        for url, sections in static.items():
+            record(url, sections)
+
+        browser_jobs = [(idx, url) for idx, url in pending if url not in static]
+        print(f"{len(static)} page(s) parsed from static HTML; {len(browser_jobs)} need a browser.")
+
+        executor = ThreadPoolExecutor(max_workers=max(1, workers))
+        try:
+            # Results are checkpointed on the main thread only
+            for (_, url), (_, sections) in zip(browser_jobs, executor.map(process_row, browser_jobs)):
+                if sections:
+                    record(url, sections)
+
+        finally:
+            # If a worker failed to start its browser, drop the rows not yet started
+            executor.shutdown(wait=True, cancel_futures=True)
+            quit_all_drivers()
+
+    # Write every scraped section back in a single update
+    results = pd.DataFrame.from_dict(
+        {idx: scraped[url] for idx, url in jobs if url in scraped}, orient="index"
+    )
+    if not results.empty:
+        df.update(results)
+
     # Save the updated data to a new Excel file
-    df.to_excel(OUTPUT_EXCEL, index=False)
+    fast_to_excel(df, OUTPUT_EXCEL)
     print(f"Saved updated data to '{OUTPUT_EXCEL}'.")
 
+    # The run completed, so the next one should start fresh
+    Path(CHECKPOINT_FILE).unlink(missing_ok=True)
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Scrape Problem/Solution/Benefit from Flintbox links.")
@@ -284,7 +690,22 @@ if __name__ == "__main__":
         default=None,
         help="Maximum number of rows to process (for testing). Omit to process all rows.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of browsers scraping in parallel (default: 1).",
+    )
+    parser.add_argument(
+        "--check-static",
+        metavar="URL",
+        default=None,
+        help="Compare the static-HTML parse of one page with the browser parse, then exit.",
+    )
     args = parser.parse_args()
 
-    main(max_rows=args.max_rows)
+    if args.check_static:
+        raise SystemExit(0 if check_static_parse(args.check_static) else 1)
+
+    main(max_rows=args.max_rows, workers=args.workers)
 
@@ -1,16 +1,30 @@
 """
 USU Patents Research Intelligence — Streamlit chatbot.
-Loads local CSV/Excel and answers questions using Claude with full patent context.
+Loads a local Excel sheet and answers questions using Claude with patent context.
 """
 import os
+import re
+from typing import Iterator
 import streamlit as st
 import pandas as pd
+import pyarrow as pa
 from anthropic import Anthropic
 from dotenv import load_dotenv
+from rank_bm25 import BM25Okapi
 
 load_dotenv()
 
 DATA_FILE = "Patents_Full_Data.xlsx"
+# Columnar copy of DATA_FILE, regenerated whenever the Excel file is newer
+PARQUET_FILE = "Patents_Full_Data.parquet"
+
+# Small sheets are sent to Claude whole (and prompt-cached). Beyond this many
+# patents, only the RETRIEVAL_TOP_K best keyword matches for the question are sent.
+RETRIEVAL_THRESHOLD = 100
+RETRIEVAL_TOP_K = 15
+
+# Columns whose text is searched when retrieving patents for a question
+SEARCH_COLUMNS = ["Title", "Problem", "Solution", "Abstract", "Benefit", "Market Application", "Inventors"]
 
 SYSTEM_PROMPT = """You are a helpful research assistant for USU (Utah State University) Patents.
 Answer questions using ONLY the patent records provided below. If the answer is not in the data, say so clearly.
@@ -18,59 +32,124 @@ Cite specific patents (title or inventor) when relevant. Be concise and accurate
 Always include the Flintbox link at the bottom of any patent detail response, formatted as a markdown link like this: [View on Flintbox](URL)"""
 
 
+def convert_xlsx_to_parquet() -> pd.DataFrame:
+    """Read the Excel sheet and save a Parquet copy next to it for fast startup."""
+    df = pd.read_excel(DATA_FILE, engine="openpyxl")
+    # Excel columns can mix types (e.g. dates and free text); Arrow needs one type per column
+    df = df.astype({col: "string" for col in df.select_dtypes("object").columns})
+    try:
+        df.to_parquet(PARQUET_FILE, index=False)
+    except (OSError, pa.ArrowException) as exc:
+        # Read-only filesystem or a column Arrow can't store; Excel still works
+        print(f"Could not write {PARQUET_FILE}, reading {DATA_FILE} instead: {exc}")
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def _read_patents(data_file_mtime: float) -> pd.DataFrame:
+    """
+    Load the sheet, preferring a Parquet copy that is at least as new as the Excel file.
+    The Excel file's mtime is only used as the cache key.
+    """
+    if os.path.exists(PARQUET_FILE) and os.path.getmtime(PARQUET_FILE) >= data_file_mtime:
+        return pd.read_parquet(PARQUET_FILE, engine="pyarrow")
+    return convert_xlsx_to_parquet()
+
+
 def load_patents():
     """Load patent data from Excel. Returns a DataFrame."""
     if not os.path.exists(DATA_FILE):
         raise FileNotFoundError(f"{DATA_FILE} not found. Add it to this folder.")
-    return pd.read_excel(DATA_FILE, engine="openpyxl")
+    # Keyed on the file's mtime so an updated sheet is picked up without a restart
+    return _read_patents(os.path.getmtime(DATA_FILE))
 
 
-def patents_to_context(df: pd.DataFrame) -> str:
+def format_patents(df: pd.DataFrame) -> str:
     """Turn the DataFrame into a single text block for the LLM context."""
-    rows = []
-    for i, row in df.iterrows():
-        rows.append(
-            f"Patent {i + 1}:\n"
-            f"  Title: {row.get('Title', '')}\n"
-            f"  Problem: {row.get('Problem', '')}\n"
-            f"  Solution: {row.get('Solution', '')}\n"
-            f"  Abstract: {row.get('Abstract', '')}\n"
-            f"  Benefit: {row.get('Benefit', '')}\n"
-            f"  Market Application: {row.get('Market Application', '')}\n"
-            f"  Inventors: {row.get('Inventors', '')}\n"
-            f"  Flintbox Link: {row.get('Flintbox Link', '')}\n"
-        )
-    return "\n".join(rows)
+    if df.empty:
+        return ""
+
+    def field(col: str) -> pd.Series:
+        if col not in df.columns:
+            return pd.Series("", index=df.index)
+        return df[col].fillna("").astype(str)
+
+    numbers = pd.Series(df.index + 1, index=df.index).astype(str)
+    blocks = (
+        "Patent " + numbers + ":\n"
+        + "  Title: " + field("Title") + "\n"
+        + "  Problem: " + field("Problem") + "\n"
+        + "  Solution: " + field("Solution") + "\n"
+        + "  Abstract: " + field("Abstract") + "\n"
+        + "  Benefit: " + field("Benefit") + "\n"
+        + "  Market Application: " + field("Market Application") + "\n"
+        + "  Inventors: " + field("Inventors") + "\n"
+        + "  Flintbox Link: " + field("Flintbox Link") + "\n"
+    )
+    return "\n".join(blocks.tolist())
 
 
-def ask_claude(user_question: str, context: str) -> str:
-    """Send user question + patent context to Claude and return the reply."""
+@st.cache_data(show_spinner=False)
+def patents_to_context(df: pd.DataFrame) -> str:
+    """Memoized format_patents() for the full sheet, which is the same on every rerun."""
+    return format_patents(df)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens used for keyword retrieval."""
+    return re.findall(r"\w+", text.lower())
+
+
+@st.cache_resource(show_spinner=False)
+def build_bm25_index(df: pd.DataFrame) -> BM25Okapi:
+    """Build a BM25 keyword index with one document per patent."""
+    cols = [c for c in SEARCH_COLUMNS if c in df.columns]
+    docs = df[cols].fillna("").astype(str).agg(" ".join, axis=1)
+    return BM25Okapi([tokenize(doc) for doc in docs])
+
+
+def select_context(df: pd.DataFrame, user_question: str) -> tuple[str, bool]:
+    """
+    Return the patent context for a question and whether it is worth prompt-caching:
+    the whole sheet (stable, cacheable) or, for large sheets, the top matches (per question).
+    """
+    if len(df) <= RETRIEVAL_THRESHOLD:
+        return patents_to_context(df), True
+    bm25 = build_bm25_index(df)
+    idxs = bm25.get_top_n(tokenize(user_question), list(range(len(df))), n=RETRIEVAL_TOP_K)
+    # Retrieved slices differ per question, so they are neither memoized nor prompt-cached
+    return format_patents(df.iloc[idxs]), False
+
+
+def ask_claude(user_question: str, context: str, cacheable: bool = True) -> Iterator[str]:
+    """Send user question + patent context to Claude and stream back the reply text."""
     try:
         api_key = st.secrets["ANTHROPIC_API_KEY"]
     except Exception:
         api_key = os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
-        return (
+        yield (
             "Error: ANTHROPIC_API_KEY is not set. "
             "Create a .env file with: ANTHROPIC_API_KEY=your_key_here"
         )
+        return
     client = Anthropic(api_key=api_key)
-    full_prompt = (
-        "Here are the patent records to use for answering:\n\n"
-        f"{context}\n\n"
-        "---\n\n"
-        f"User question: {user_question}"
-    )
+    records = {"type": "text", "text": f"Here are the patent records to use for answering:\n\n{context}"}
+    # When the full sheet is sent, the records are identical on every call, so mark
+    # them as a cacheable prefix; only the short question changes between requests.
+    if cacheable:
+        records["cache_control"] = {"type": "ephemeral"}
+    content = [records, {"type": "text", "text": f"---\n\nUser question: {user_question}"}]
     try:
-        message = client.messages.create(
+        with client.messages.stream(
             model="claude-haiku-4-5-20251001",
             max_tokens=1024,
             system=SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": full_prompt}],
-        )
-        return message.content[0].text
+            messages=[{"role": "user", "content": content}],
+        ) as stream:
+            yield from stream.text_stream
     except Exception as e:
-        return f"API error: {str(e)}"
+        yield f"API error: {str(e)}"
 
 
 def main():
@@ -85,7 +164,6 @@ def main():
 
     try:
         df = load_patents()
-        context = patents_to_context(df)
         st.sidebar.success(f"Loaded {len(df)} patent(s) from {DATA_FILE}.")
         if st.sidebar.button("Reset", help="Clear chat and start again"):
             st.session_state.messages = []
@@ -111,9 +189,8 @@ def main():
             st.markdown(prompt)
 
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                reply = ask_claude(prompt, context)
-            st.markdown(reply)
+            context, cacheable = select_context(df, prompt)
+            reply = st.write_stream(ask_claude(prompt, context, cacheable))
             st.caption(LICENSING_MSG)
         st.session_state.messages.append({"role": "assistant", "content": reply})
 